@@ -7,21 +7,22 @@ The output file will be saved in the same directory as this script.
 """
 
 import os
-import glob
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+from collections import deque
 import argparse
+import hashlib
 import sys
+import io
 
 try:
     from PyPDF2 import PdfReader, PdfWriter
-    import pdfplumber
-    from PIL import Image, ImageDraw
-    import cv2
-    import numpy as np
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    import io
+    from PyPDF2.generic import (
+        ContentStream, IndirectObject, NameObject, RectangleObject, StreamObject
+    )
 except ImportError as e:
     print(f"Error: Required packages are not installed.")
     print(f"Missing: {e.name}")
@@ -29,6 +30,50 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Directory containing this script, resolved once at import time
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Number of progress messages buffered before they are written to stdout
+_MESSAGE_BATCH_SIZE = 100
+
+# Where watermark-stripped PDFs are kept between runs when caching is enabled.
+# Bump _CACHE_VERSION whenever processing output changes to invalidate old entries.
+_CACHE_VERSION = 1
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'combine-pdfs'
+)
+
+
+@lru_cache(maxsize=32)
+def _list_pdf_files(source_folder, folder_mtime_ns):
+    """
+    Scan a folder for PDF files.
+    
+    Cached on the folder's modification time, which changes whenever an
+    entry is added, removed or renamed, so a stale listing is never returned.
+    
+    Args:
+        source_folder (str): Path to the folder containing source PDFs
+        folder_mtime_ns (int): Modification time of the folder (cache key only)
+        
+    Returns:
+        tuple: PDF file paths sorted alphabetically
+    """
+    # A single scandir pass; DirEntry.is_file() uses the cached entry type,
+    # so regular files are not stat'ed individually
+    with os.scandir(source_folder) as entries:
+        pdf_files = [
+            entry.path for entry in entries
+            if not entry.name.startswith('.')
+            and entry.name.lower().endswith('.pdf')
+            and entry.is_file()
+        ]
+    
+    pdf_files.sort()
+    return tuple(pdf_files)
+
+
 def get_pdf_files(source_folder):
     """
     Get all PDF files from the source folder.
@@ -39,128 +84,472 @@ def get_pdf_files(source_folder):
     Returns:
         list: List of PDF file paths sorted alphabetically
     """
-    pdf_pattern = os.path.join(source_folder, "*.pdf")
-    pdf_files = glob.glob(pdf_pattern)
-    return sorted(pdf_files)
+    folder_mtime_ns = os.stat(source_folder).st_mtime_ns
+    return list(_list_pdf_files(source_folder, folder_mtime_ns))
+
+
+def _copy_original(pdf_path, output_stream):
+    """
+    Replace the contents of an output stream with the unmodified input PDF.
+    
+    Args:
+        pdf_path (str): Path to input PDF
+        output_stream (BinaryIO): Seekable binary stream to write to
+    
+    Returns:
+        BinaryIO: The output stream
+    """
+    import shutil
+    output_stream.seek(0)
+    output_stream.truncate()
+    with open(pdf_path, 'rb') as input_file:
+        shutil.copyfileobj(input_file, output_stream)
+    return output_stream
 
 
-def remove_watermark_region(pdf_path, output_path, bottom_height_percent=15):
+def remove_watermark_region(pdf_path, output_stream, bottom_height_percent=15, fallback=True):
     """
     Remove watermark from bottom region of PDF pages.
     
+    The pages are not rasterized; the bottom region (as the page is displayed,
+    taking /Rotate into account) is hidden by moving that edge of each page's
+    CropBox inwards, so text and vector content survive.
+    
     Args:
         pdf_path (str): Path to input PDF
-        output_path (str): Path for output PDF
+        output_stream (BinaryIO): Seekable binary stream to write the output PDF to
         bottom_height_percent (int): Percentage of page height to crop from bottom
+        fallback (bool): Copy the original file if processing fails; when
+                         False the error is raised instead
     
     Returns:
-        str: Path to the processed PDF
+        BinaryIO: The output stream
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            pdf_writer = PdfWriter()
-            
-            for page_num, page in enumerate(pdf.pages):
-                # Convert page to image
-                img = page.to_image(resolution=200)
-                
-                # Get the actual PIL image from PageImage object
-                pil_img = img.original
-                
-                # Crop bottom portion
-                img_width, img_height = pil_img.size
-                crop_bottom = int(img_height * (bottom_height_percent / 100))
-                
-                # Crop the image (remove bottom portion)
-                cropped_img = pil_img.crop((0, 0, img_width, img_height - crop_bottom))
-                
-                # Save cropped image to bytes
-                img_bytes = io.BytesIO()
-                cropped_img.save(img_bytes, format='PDF')
-                img_bytes.seek(0)
-                
-                # Read the cropped image as PDF and add to writer
-                cropped_pdf = PdfReader(img_bytes)
-                if len(cropped_pdf.pages) > 0:
-                    pdf_writer.add_page(cropped_pdf.pages[0])
+        pdf_reader = PdfReader(pdf_path, strict=False)
+        pdf_writer = PdfWriter()
+        
+        for page in pdf_reader.pages:
+            # Move the displayed bottom edge of the visible area inwards
+            # instead of rasterizing, so the original text and vector content
+            # is kept. Start from the existing CropBox (which defaults to the
+            # MediaBox) so margins that are already hidden stay hidden.
+            crop_box = page.cropbox
+            left, bottom = float(crop_box.left), float(crop_box.bottom)
+            right, top = float(crop_box.right), float(crop_box.top)
             
-            # Write the processed PDF
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
+            # /Rotate turns the page clockwise for display, so a different
+            # edge of the unrotated box ends up at the bottom of the screen
+            rotation = int(page.get('/Rotate', 0)) % 360
             
-            return output_path
+            if rotation == 90:
+                right -= (right - left) * (bottom_height_percent / 100)
+            elif rotation == 180:
+                top -= (top - bottom) * (bottom_height_percent / 100)
+            elif rotation == 270:
+                left += (right - left) * (bottom_height_percent / 100)
+            else:
+                bottom += (top - bottom) * (bottom_height_percent / 100)
             
+            page.cropbox = RectangleObject([left, bottom, right, top])
+        
+        # Copy all adjusted pages across in a single call
+        pdf_writer.append(pdf_reader, import_outline=False)
+        
+        # Write the processed PDF
+        pdf_writer.write(output_stream)
+        
+        return output_stream
+        
     except Exception as e:
+        if not fallback:
+            raise
         print(f"Warning: Could not remove watermark from {pdf_path}: {str(e)}")
         # If watermark removal fails, copy original file
-        import shutil
-        shutil.copy2(pdf_path, output_path)
-        return output_path
+        return _copy_original(pdf_path, output_stream)
+
+
+@lru_cache(maxsize=None)
+def _load_whiten_kernel():
+    """
+    Compile the Numba kernel used by _whiten_light_pixels.
+    
+    Numba is optional and slow to import, so it is only loaded on first use.
+    
+    Returns:
+        callable: The compiled kernel, or None if Numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    # nogil lets the encoder threads run the kernel concurrently
+    @njit(cache=True, nogil=True)
+    def whiten(img, thresh):
+        height, width = img.shape[0], img.shape[1]
+        for y in range(height):
+            for x in range(width):
+                luminance = 0.299 * img[y, x, 0] + 0.587 * img[y, x, 1] + 0.114 * img[y, x, 2]
+                if luminance > thresh:
+                    img[y, x, 0] = 255
+                    img[y, x, 1] = 255
+                    img[y, x, 2] = 255
+    
+    return whiten
 
 
-def remove_watermark_opencv(pdf_path, output_path):
+def _whiten_light_pixels(img, thresh):
+    """
+    Turn every pixel lighter than a threshold pure white, in place.
+    
+    Uses a single fused pass compiled with Numba when it is installed,
+    otherwise falls back to NumPy.
+    
+    Args:
+        img (ndarray): Writable RGB image array of shape (height, width, 3)
+        thresh (int): Luminance (0-255) above which pixels are whitened
+    """
+    import numpy as np
+    
+    kernel = _load_whiten_kernel()
+    if kernel is not None:
+        kernel(img, thresh)
+    else:
+        luminance = img @ np.array([0.299, 0.587, 0.114])
+        img[luminance > thresh] = 255
+
+
+def _encode_page(pil_img, whiten_threshold=None):
+    """
+    Encode a rendered page image as JPEG.
+    
+    Pillow's JPEG encoder releases the GIL, so this is run in worker threads.
+    
+    Args:
+        pil_img (Image): Rendered page image
+        whiten_threshold (int, optional): Luminance (0-255) above which pixels
+                                          are turned pure white before encoding
+    
+    Returns:
+        bytes: JPEG-encoded image
+    """
+    # Optional: Remove faint watermark remnants and scanner background noise
+    # This is aggressive and might remove light legitimate content
+    if whiten_threshold is not None:
+        import numpy as np
+        from PIL import Image
+        
+        rgb_img = np.array(pil_img.convert('RGB'))
+        _whiten_light_pixels(rgb_img, whiten_threshold)
+        pil_img = Image.fromarray(rgb_img)
+    
+    # Encode as JPEG so the page embeds it as-is (DCTDecode)
+    img_bytes = io.BytesIO()
+    pil_img.save(img_bytes, format='JPEG', quality=75, optimize=False)
+    
+    return img_bytes.getvalue()
+
+
+def remove_watermark_opencv(pdf_path, output_stream, whiten_threshold=None, max_workers=None,
+                            fallback=True):
     """
     Advanced watermark removal using OpenCV for image processing.
     
+    Each page is rasterized, so only use this for scanned (bitmap) PDFs.
+    
     Args:
         pdf_path (str): Path to input PDF
-        output_path (str): Path for output PDF
+        output_stream (BinaryIO): Seekable binary stream to write the output PDF to
+        whiten_threshold (int, optional): Luminance (0-255) above which pixels
+                                          are turned pure white
+        max_workers (int, optional): Number of JPEG encoder threads. Defaults
+                                     to min(8, CPU count); pass 1 when already
+                                     running one call per core
+        fallback (bool): Use the crop method if processing fails; when False
+                         the error is raised instead
     
     Returns:
-        str: Path to the processed PDF
+        BinaryIO: The output stream
     """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    
+    # Bound the number of rendered pages waiting for the encoder, so memory
+    # does not grow when rendering outpaces encoding
+    max_pending = 2 * max_workers
+    
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            pdf_writer = PdfWriter()
+        # The imaging stack is slow to import, so it is only loaded when
+        # this method is actually used
+        import pypdfium2 as pdfium
+        from reportlab.lib.utils import ImageReader
+        from reportlab.pdfgen import canvas
+        
+        # Render with PDFium directly; unlike pdfplumber it does not build
+        # a text layout tree that would be thrown away
+        pdf = pdfium.PdfDocument(pdf_path)
+        
+        # Draw the processed images straight onto one output canvas so
+        # each page is encoded once, with no intermediate PDF to re-parse.
+        # The canvas is not thread-safe, so it is only used from this thread.
+        pdf_canvas = canvas.Canvas(output_stream, pageCompression=1)
+        
+        def draw_page(page_size, future):
+            page_width, page_height = page_size
             
-            for page_num, page in enumerate(pdf.pages):
-                # Convert page to image with high resolution
-                img = page.to_image(resolution=300)
-                
-                # Get the actual PIL image from PageImage object
-                pil_img = img.original
-                
-                # Convert PIL image to OpenCV format
-                opencv_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-                
-                # Remove bottom 15% of the image (common watermark location)
-                height, width = opencv_img.shape[:2]
-                crop_height = int(height * 0.85)  # Keep top 85%
-                cropped_img = opencv_img[0:crop_height, 0:width]
-                
-                # Optional: Apply additional filtering to remove text-like watermarks
-                # This is aggressive and might remove legitimate content
-                # Uncomment if needed:
-                # gray = cv2.cvtColor(cropped_img, cv2.COLOR_BGR2GRAY)
-                # _, thresh = cv2.threshold(gray, 240, 255, cv2.THRESH_BINARY)
-                # cropped_img = cv2.cvtColor(thresh, cv2.COLOR_GRAY2BGR)
-                
-                # Convert back to PIL Image
-                processed_img = Image.fromarray(cv2.cvtColor(cropped_img, cv2.COLOR_BGR2RGB))
-                
-                # Convert to PDF page
-                img_bytes = io.BytesIO()
-                processed_img.save(img_bytes, format='PDF')
-                img_bytes.seek(0)
+            # Add to PDF canvas at the cropped page size
+            pdf_canvas.setPageSize((page_width, page_height))
+            pdf_canvas.drawImage(
+                ImageReader(io.BytesIO(future.result())), 0, 0, page_width, page_height
+            )
+            pdf_canvas.showPage()
+        
+        try:
+            # PDFium is not thread-safe, so pages are rendered here one at a
+            # time while JPEG encoding runs in worker threads
+            pending_pages = deque()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for page in pdf:
+                    page_width, page_height = page.get_size()
+                    
+                    # Remove bottom 15% of the page (common watermark location)
+                    # by having PDFium render only the top 85% at 300 DPI, so
+                    # the discarded band is never rasterized
+                    crop_bottom = page_height * 0.15
+                    pil_img = page.render(scale=300 / 72, crop=(0, crop_bottom, 0, 0)).to_pil()
+                    
+                    pending_pages.append((
+                        (page_width, page_height - crop_bottom),
+                        executor.submit(_encode_page, pil_img, whiten_threshold)
+                    ))
+                    
+                    # Draw finished pages in order once too many are queued
+                    while len(pending_pages) > max_pending:
+                        draw_page(*pending_pages.popleft())
                 
-                # Add to PDF writer
-                processed_pdf = PdfReader(img_bytes)
-                if len(processed_pdf.pages) > 0:
-                    pdf_writer.add_page(processed_pdf.pages[0])
-            
-            # Write the processed PDF
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
-            
-            return output_path
-            
+                while pending_pages:
+                    draw_page(*pending_pages.popleft())
+        finally:
+            pdf.close()
+        
+        # Write the processed PDF
+        pdf_canvas.save()
+        
+        return output_stream
+        
     except Exception as e:
+        if not fallback:
+            raise
         print(f"Warning: Could not process {pdf_path} with OpenCV: {str(e)}")
         # Fallback to simple crop method
-        return remove_watermark_region(pdf_path, output_path)
+        output_stream.seek(0)
+        output_stream.truncate()
+        return remove_watermark_region(pdf_path, output_stream)
 
 
-def combine_pdfs(source_folder, output_filename=None, remove_watermarks=False, watermark_method='crop'):
+def _cache_path(pdf_file, watermark_method, whiten_threshold, cache_dir):
+    """
+    Get the cache location for a processed PDF.
+    
+    The key covers the cache format version, the file's absolute path,
+    modification time and size plus the processing options, so any change
+    to the input, the options or the processing code results in a different entry.
+    
+    Args:
+        pdf_file (str): Path to the source PDF
+        watermark_method (str): Method used ('crop' or 'opencv')
+        whiten_threshold (int, optional): Luminance threshold for the opencv method
+        cache_dir (str): Cache folder
+    
+    Returns:
+        str: Path of the cache entry
+    """
+    stat = os.stat(pdf_file)
+    key = "|".join(str(part) for part in (
+        _CACHE_VERSION, os.path.abspath(pdf_file), stat.st_mtime_ns, stat.st_size,
+        watermark_method, whiten_threshold
+    ))
+    return os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.pdf')
+
+
+def _process_one(pdf_file, watermark_method, whiten_threshold=None, cache_dir=None,
+                 encoder_threads=None):
+    """
+    Remove watermarks from a single PDF. Runs in a worker process.
+    
+    The processed PDF is kept in memory and returned as bytes, so nothing
+    is written to disk between processing and merging. When a cache folder
+    is given, results are reused across runs for unchanged inputs.
+    
+    Args:
+        pdf_file (str): Path to the source PDF
+        watermark_method (str): Method to use ('crop' or 'opencv')
+        whiten_threshold (int, optional): Luminance threshold for the opencv method
+        cache_dir (str, optional): Folder for caching processed PDFs between runs
+        encoder_threads (int, optional): JPEG encoder threads for the opencv method
+    
+    Returns:
+        bytes: The processed PDF, or None if the file could not be processed
+    """
+    try:
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = _cache_path(pdf_file, watermark_method, whiten_threshold, cache_dir)
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    return cache_file.read()
+            except OSError:
+                pass
+        
+        output_stream = io.BytesIO()
+        
+        # Fallbacks are handled here rather than inside the remove functions,
+        # so only output of the requested method is ever cached
+        try:
+            if watermark_method == 'opencv':
+                remove_watermark_opencv(
+                    pdf_file, output_stream, whiten_threshold, encoder_threads, fallback=False
+                )
+            else:
+                remove_watermark_region(pdf_file, output_stream, fallback=False)
+        except Exception as e:
+            cache_path = None
+            if watermark_method == 'opencv':
+                print(f"Warning: Could not process {pdf_file} with OpenCV: {str(e)}")
+                # Fallback to simple crop method
+                output_stream = io.BytesIO()
+                remove_watermark_region(pdf_file, output_stream)
+            else:
+                print(f"Warning: Could not remove watermark from {pdf_file}: {str(e)}")
+                # If watermark removal fails, copy original file
+                _copy_original(pdf_file, output_stream)
+        
+        pdf_data = output_stream.getvalue()
+        
+        # Store the result for the next run; write to a temporary name first
+        # so a concurrent run never reads a partially written entry
+        if cache_path is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temp_path, 'wb') as cache_file:
+                    cache_file.write(pdf_data)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Warning: Could not cache {pdf_file}: {str(e)}")
+        
+        return pdf_data
+        
+    except Exception as e:
+        print(f"Warning: Could not process {pdf_file}: {str(e)}")
+        return None
+
+
+def _is_flate_encoded(page):
+    """
+    Check whether all content streams of a page are already Flate-compressed.
+    
+    Args:
+        page (PageObject): Page to inspect
+    
+    Returns:
+        bool: True if every content stream uses FlateDecode (or there are none)
+    """
+    contents = page.get("/Contents")
+    if contents is None:
+        return True
+    
+    contents = contents.get_object()
+    streams = contents if isinstance(contents, list) else [contents]
+    
+    for stream in streams:
+        filters = stream.get_object().get("/Filter")
+        if isinstance(filters, list):
+            if "/FlateDecode" not in filters:
+                return False
+        elif filters != "/FlateDecode":
+            return False
+    
+    return True
+
+
+def _write_messages(messages):
+    """
+    Write buffered progress messages to stdout in one call and clear the buffer.
+    
+    Args:
+        messages (list): Pending messages, one per line
+    """
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
+        messages.clear()
+
+
+def _combine_with_pikepdf(pdf_files, output_path, compress=False):
+    """
+    Concatenate PDF files with pikepdf (qpdf) instead of PyPDF2.
+    
+    Pages are copied by qpdf in C++ and content streams are passed through
+    as-is, which is much faster for a plain merge. No pages are modified.
+    
+    Args:
+        pdf_files (list): Paths of the PDFs to combine, in order
+        output_path (str): Path for the combined PDF
+        compress (bool): Whether to compress uncompressed streams
+    
+    Returns:
+        int: Total number of pages in the combined PDF
+    """
+    import pikepdf
+    
+    combined_pdf = pikepdf.Pdf.new()
+    
+    # Source PDFs must stay open until the combined PDF has been saved
+    source_pdfs = []
+    messages = []
+    
+    try:
+        for pdf_file in pdf_files:
+            if len(messages) >= _MESSAGE_BATCH_SIZE:
+                _write_messages(messages)
+            
+            try:
+                messages.append(f"Processing: {os.path.basename(pdf_file)}")
+                
+                # Read the file into memory so no file descriptor stays open
+                # per input; large folders would otherwise hit the open-file limit
+                with open(pdf_file, 'rb') as input_file:
+                    source_pdf = pikepdf.Pdf.open(io.BytesIO(input_file.read()))
+                source_pdfs.append(source_pdf)
+                combined_pdf.pages.extend(source_pdf.pages)
+                
+            except Exception as e:
+                messages.append(f"Warning: Could not process {pdf_file}: {str(e)}")
+                continue
+        
+        _write_messages(messages)
+        
+        # Write the combined PDF
+        try:
+            combined_pdf.save(
+                output_path,
+                compress_streams=compress,
+                object_stream_mode=pikepdf.ObjectStreamMode.generate
+            )
+        except Exception as e:
+            raise Exception(f"Failed to write combined PDF: {str(e)}")
+        
+        return len(combined_pdf.pages)
+        
+    finally:
+        for source_pdf in source_pdfs:
+            source_pdf.close()
+        combined_pdf.close()
+
+
+def combine_pdfs(source_folder, output_filename=None, remove_watermarks=False, watermark_method='crop',
+                 compress=False, whiten_threshold=None, fast=False, use_cache=False):
     """
     Combine all PDF files from the source folder into a single PDF.
     
@@ -170,19 +559,32 @@ def combine_pdfs(source_folder, output_filename=None, remove_watermarks=False, w
                                        generates a timestamped filename.
         remove_watermarks (bool): Whether to attempt watermark removal
         watermark_method (str): Method to use ('crop' or 'opencv')
+        compress (bool): Whether to compress uncompressed content streams
+                         in the combined PDF before writing it
+        whiten_threshold (int, optional): With the opencv method, turn pixels
+                                          lighter than this luminance (0-255) white
+        fast (bool): Merge with pikepdf when it is installed and no watermark
+                     removal is requested; falls back to PyPDF2 otherwise
+        use_cache (bool): Reuse watermark-stripped PDFs from previous runs for
+                          inputs that have not changed
         
     Returns:
         str: Path to the created combined PDF file
     """
+    if whiten_threshold is not None and not 0 <= whiten_threshold <= 255:
+        raise ValueError(f"whiten_threshold must be between 0 and 255, got {whiten_threshold}")
+    
     # Get all PDF files
     pdf_files = get_pdf_files(source_folder)
     
     if not pdf_files:
         raise ValueError(f"No PDF files found in {source_folder}")
     
+    # Print the listing as one write rather than one per file
     print(f"Found {len(pdf_files)} PDF files to combine:")
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"  {i}. {os.path.basename(pdf_file)}")
+    print("\n".join(
+        f"  {i}. {os.path.basename(pdf_file)}" for i, pdf_file in enumerate(pdf_files, 1)
+    ))
     
     # Create output filename if not provided
     if output_filename is None:
@@ -194,53 +596,115 @@ def combine_pdfs(source_folder, output_filename=None, remove_watermarks=False, w
         output_filename += '.pdf'
     
     # Create the output path in the pdfs/output directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_dir = os.path.join(os.path.dirname(script_dir), 'pdfs', 'output')
+    output_dir = os.path.join(os.path.dirname(_SCRIPT_DIR), 'pdfs', 'output')
     
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
     
     output_path = os.path.join(output_dir, output_filename)
     
+    # Plain concatenation can be handed to qpdf, which copies pages natively
+    if fast and not remove_watermarks:
+        try:
+            total_pages = _combine_with_pikepdf(pdf_files, output_path, compress)
+        except ImportError:
+            print("Warning: pikepdf is not installed, using PyPDF2 instead.")
+        else:
+            print(f"\nSuccess! Combined PDF created: {output_path}")
+            print(f"Total pages in combined PDF: {total_pages}")
+            return output_path
+    
     # Create PDF writer object
     pdf_writer = PdfWriter()
     
-    # Add pages from each PDF file
-    for pdf_file in pdf_files:
-        try:
-            print(f"Processing: {os.path.basename(pdf_file)}")
+    # Process files in parallel; they are independent of each other, and
+    # watermark removal is CPU-bound so worker processes avoid the GIL.
+    # Results are consumed lazily by the merge loop below, so each processed
+    # PDF is released as soon as it has been appended.
+    executor = None
+    if remove_watermarks:
+        # Split the cores between worker processes and the encoder threads
+        # each of them starts, so the machine is not oversubscribed
+        cpu_count = os.cpu_count() or 1
+        workers = min(cpu_count, len(pdf_files))
+        encoder_threads = max(1, cpu_count // workers)
+        chunksize = max(1, len(pdf_files) // (4 * workers))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        processed_data = executor.map(
+            partial(
+                _process_one,
+                watermark_method=watermark_method,
+                whiten_threshold=whiten_threshold,
+                cache_dir=_CACHE_DIR if use_cache else None,
+                encoder_threads=encoder_threads
+            ),
+            pdf_files,
+            chunksize=chunksize
+        )
+    else:
+        processed_data = repeat(None)
+    
+    # Progress messages are buffered and written in batches, so large
+    # folders do not cost one terminal write per file
+    messages = []
+    
+    try:
+        # Merge the files serially, preserving the sorted order
+        for pdf_file, pdf_data in zip(pdf_files, processed_data):
+            if len(messages) >= _MESSAGE_BATCH_SIZE:
+                _write_messages(messages)
+            
+            if remove_watermarks and pdf_data is None:
+                continue
             
-            # Process file for watermark removal if requested
-            if remove_watermarks:
-                temp_file = os.path.join(script_dir, f"temp_{os.path.basename(pdf_file)}")
+            try:
+                messages.append(f"Processing: {os.path.basename(pdf_file)}")
                 
-                if watermark_method == 'opencv':
-                    processed_file = remove_watermark_opencv(pdf_file, temp_file)
+                if remove_watermarks:
+                    pdf_stream = io.BytesIO(pdf_data)
                 else:
-                    processed_file = remove_watermark_region(pdf_file, temp_file)
+                    pdf_stream = open(pdf_file, 'rb')
                 
-                pdf_reader = PdfReader(processed_file)
-                
-                # Clean up temporary file
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
-            else:
-                pdf_reader = PdfReader(pdf_file)
+                # Append all pages from the current PDF in one call and release
+                # the reader (and its parsed xref) as soon as the pages are copied
+                with pdf_stream:
+                    pdf_reader = PdfReader(pdf_stream, strict=False)
+                    pdf_writer.append(pdf_reader, import_outline=False)
+                    del pdf_reader
             
-            # Add all pages from the current PDF
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                pdf_writer.add_page(page)
+            except Exception as e:
+                messages.append(f"Warning: Could not process {pdf_file}: {str(e)}")
+                continue
+    
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    _write_messages(messages)
+    
+    # Compress once over the merged pages rather than while adding them,
+    # and leave streams that are already deflated alone
+    if compress:
+        for page in pdf_writer.pages:
+            if not _is_flate_encoded(page):
+                # PageObject.compress_content_streams() would store the new
+                # stream directly in the page dictionary, which is not valid
+                # PDF, so register it with the writer as an indirect object
+                contents_ref = page.raw_get('/Contents')
+                compressed = ContentStream(page.get_contents(), pdf_writer).flate_encode()
                 
-        except Exception as e:
-            print(f"Warning: Could not process {pdf_file}: {str(e)}")
-            continue
+                if isinstance(contents_ref, IndirectObject) and isinstance(
+                        contents_ref.get_object(), StreamObject):
+                    # Reuse the existing object slot so the uncompressed
+                    # stream is not also written out as an orphan
+                    pdf_writer._objects[contents_ref.idnum - 1] = compressed
+                else:
+                    page[NameObject('/Contents')] = pdf_writer._add_object(compressed)
     
     # Write the combined PDF
     try:
-        with open(output_path, 'wb') as output_file:
+        # Use a large write buffer so serialization flushes in big chunks
+        with open(output_path, 'wb', buffering=1 << 20) as output_file:
             pdf_writer.write(output_file)
         
         print(f"\nSuccess! Combined PDF created: {output_path}")
@@ -263,6 +727,7 @@ Examples:
   python combine_pdfs.py -s /path/to/pdfs   # Specify source folder
   python combine_pdfs.py --remove-watermarks # Remove watermarks using crop method
   python combine_pdfs.py --remove-watermarks --watermark-method opencv # Advanced removal
+  python combine_pdfs.py --fast             # Merge with pikepdf if installed
         """
     )
     
@@ -296,15 +761,44 @@ Examples:
         help='Method for watermark removal: crop (simple) or opencv (advanced)'
     )
     
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Compress uncompressed page content streams in the combined PDF'
+    )
+    
+    parser.add_argument(
+        '--whiten-threshold',
+        type=int,
+        metavar='LEVEL',
+        help='With the opencv method, turn pixels lighter than LEVEL (0-255) pure white'
+    )
+    
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Merge with pikepdf (if installed) when not removing watermarks'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse watermark-removal results from previous runs for unchanged files'
+    )
+    
     args = parser.parse_args()
     
-    # Get the absolute path of the source folder
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if args.whiten_threshold is not None:
+        if not 0 <= args.whiten_threshold <= 255:
+            parser.error("--whiten-threshold must be between 0 and 255")
+        if not args.remove_watermarks or args.watermark_method != 'opencv':
+            parser.error("--whiten-threshold requires --remove-watermarks --watermark-method opencv")
     
+    # Get the absolute path of the source folder
     if os.path.isabs(args.source):
         source_folder = args.source
     else:
-        source_folder = os.path.join(script_dir, args.source)
+        source_folder = os.path.join(_SCRIPT_DIR, args.source)
     
     # Check if source folder exists
     if not os.path.exists(source_folder):
@@ -327,7 +821,11 @@ Examples:
             source_folder, 
             args.output, 
             remove_watermarks=args.remove_watermarks,
-            watermark_method=args.watermark_method
+            watermark_method=args.watermark_method,
+            compress=args.compress,
+            whiten_threshold=args.whiten_threshold,
+            fast=args.fast,
+            use_cache=args.cache
         )
         
         if args.verbose:
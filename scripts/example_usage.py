@@ -9,14 +9,16 @@ import os
 import sys
 from combine_pdfs import combine_pdfs, get_pdf_files
 
+# Directory containing this script, resolved once at import time
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def main():
     """Demonstrate different usage patterns of the PDF combiner."""
     
     print("=== PDF Combiner Example ===\n")
     
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    source_folder = os.path.join(os.path.dirname(script_dir), "pdfs", "source")
+    # Source folder relative to the directory where this script is located
+    source_folder = os.path.join(os.path.dirname(_SCRIPT_DIR), "pdfs", "source")
     
     # Check if source folder exists
     if not os.path.exists(source_folder):
@@ -8,6 +8,7 @@ This script helps set up the environment and install dependencies.
 import subprocess
 import sys
 import os
+import importlib.util
 
 def install_package(package_name):
     """Install a package using pip."""
@@ -31,20 +32,19 @@ def check_dependencies():
     """Check if required dependencies are installed."""
     required_packages = [
         ('PyPDF2', 'PyPDF2'),
-        ('pdfplumber', 'pdfplumber'), 
+        ('pypdfium2', 'pypdfium2'), 
         ('Pillow', 'PIL'),
         ('reportlab', 'reportlab'),
-        ('opencv-python', 'cv2'),
         ('numpy', 'numpy')
     ]
     
     missing_packages = []
     
     for package_name, import_name in required_packages:
-        try:
-            __import__(import_name)
+        # find_spec only locates the package, it does not execute it
+        if importlib.util.find_spec(import_name) is not None:
             print(f"✓ {package_name} is already installed")
-        except ImportError:
+        else:
             print(f"✗ {package_name} is not installed")
             missing_packages.append(package_name)
     